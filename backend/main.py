@@ -5,22 +5,76 @@ Using real-time data from OpenAQ API + Open-Meteo Weather
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Optional
+from contextlib import asynccontextmanager, nullcontext, suppress
+from functools import lru_cache
+import logging
+import logging.handlers
+import math
+import queue
 import random
-import threading
+import sys
 import time
 import httpx
+import orjson
+import redis.asyncio as aioredis
 import asyncio
+import socket
 from datetime import datetime
 
 import os 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Update-loop logging: records are queued from the event loop and written to
+# stdout by a listener thread, so logging never blocks on a console write
+LOG_QUEUE = queue.SimpleQueue()
+logger = logging.getLogger("upde")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(LOG_QUEUE))
+logger.propagate = False
+
+_log_output = logging.StreamHandler(sys.stdout)
+_log_output.setFormatter(logging.Formatter("%(message)s"))
+LOG_LISTENER = logging.handlers.QueueListener(LOG_QUEUE, _log_output)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared HTTP client and start the background updater"""
+    global HTTP_CLIENT, REDIS
+    LOG_LISTENER.start()
+    if REDIS_URL:
+        REDIS = aioredis.from_url(REDIS_URL)
+    # One pooled client for the whole process: keep-alive connections and
+    # HTTP/2 multiplexing avoid a new TCP+TLS handshake on every request
+    HTTP_CLIENT = httpx.AsyncClient(
+        base_url=WAQI_BASE,
+        http2=True,
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    )
+    update_task = asyncio.create_task(update_all_sectors())
+    try:
+        yield
+    finally:
+        # Stop the updater and let any in-flight fetches unwind before the
+        # client they are using is closed
+        update_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await update_task
+        await HTTP_CLIENT.aclose()
+        if REDIS is not None:
+            await REDIS.aclose()
+        LOG_LISTENER.stop()  # Flushes any queued records
+
+
 app = FastAPI(
     title="Urban Policy Decision Engine",
-    description="Air Quality Policy Recommendation System - Real-time Data"
+    description="Air Quality Policy Recommendation System - Real-time Data",
+    lifespan=lifespan
 )
 
 # Enable CORS for React frontend
@@ -38,16 +92,22 @@ app.add_middleware(
 # ============================================================================
 
 class SectorReading(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     sector_id: int
     sector_name: str
     pm25: float
     pm10: float
     traffic_index: float
     wind_speed: float
+    last_update: Optional[str]  # When the readings were taken; None before the first update
     timestamp: str
 
 
 class PolicyRecommendation(BaseModel):
+    # Frozen: instances are shared through generate_policy_recommendation's cache
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     policy_name: str
     reason: str
     expected_pm25_reduction_percentage: float
@@ -83,13 +143,95 @@ SECTORS_CONFIG = {
     }
 }
 
+# Hour-of-day schedules, indexed by datetime.hour (0-23)
+# Simulated traffic multiplier: night 22:00-05:59, rush hour 08:00-10:59 and 17:00-19:59
+HOUR_TRAFFIC_MULT = (
+    0.4, 0.4, 0.4, 0.4, 0.4, 0.4,  # 00-05 night
+    1.0, 1.0,                      # 06-07
+    1.3, 1.3, 1.3,                 # 08-10 rush hour
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,  # 11-16
+    1.3, 1.3, 1.3,                 # 17-19 rush hour
+    1.0, 1.0,                      # 20-21
+    0.4, 0.4,                      # 22-23 night
+)
+# Daytime boundary layer (better vertical mixing) from 06:00 to 18:59
+HOUR_IS_DAY = (False,) * 6 + (True,) * 13 + (False,) * 5
+
 # In-memory cache for sector data
 SECTORS_DATA = {}
 
+# Short-lived cache of read endpoint responses: key -> (expires_at, data_version, payload)
+# Entries also expire as soon as the background updater bumps DATA_VERSION.
+# Payloads leave out the response timestamp, which is added per request
+RESPONSE_CACHE_TTL = 10.0  # seconds
+RESPONSE_CACHE: Dict[tuple, tuple] = {}
+DATA_VERSION = 0
+
 # WAQI API (World Air Quality Index) - Using user's API token
 WAQI_TOKEN = os.getenv("WAQI_API_KEY", "demo")
 WAQI_BASE = os.getenv("WAQI_BASE", "https://api.waqi.info")
 
+# Random source for simulated readings when live data is missing;
+# set SIMULATION_SEED for reproducible runs
+SIMULATION_SEED = os.getenv("SIMULATION_SEED")
+RNG = random.Random(int(SIMULATION_SEED) if SIMULATION_SEED else None)
+
+# Optional Redis for sharing sector data between uvicorn workers. When set, one
+# worker (holder of the refresh lock) polls the upstream APIs and publishes
+# versioned snapshots; every worker checks the version every
+# SHARED_POLL_INTERVAL seconds and loads new snapshots into its SECTORS_DATA.
+# The holder renews the lock on every check, so it stays the refresher (and
+# keeps its circuit breakers and conditional-request validators) until it stops
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_PREFIX = os.getenv("REDIS_PREFIX", "upde")
+REDIS: Optional[aioredis.Redis] = None
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"  # Refresh lock value
+SHARED_VERSION: Optional[int] = None  # Snapshot version this worker last loaded or published
+
+# Seconds between update cycles; also the refresh lock lifetime, so another
+# worker takes over at most one cycle after the holder stops renewing it
+UPDATE_INTERVAL = 60
+SHARED_POLL_INTERVAL = 2
+
+# Renew the lock if this worker holds it, otherwise try to take it
+REFRESH_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+# Shared async HTTP client (base URL: WAQI), opened and closed by the app lifespan
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Validators and parsed bodies of earlier responses, for conditional requests:
+# request tag -> (etag, last_modified, data)
+CONDITIONAL_CACHE: Dict[str, tuple] = {}
+
+# Circuit breaker per upstream: after BREAKER_FAILURE_THRESHOLD consecutive
+# failures its requests are skipped for BREAKER_COOLDOWN seconds, then a single
+# probe request is let through while the rest are still skipped. The cool-down
+# spans more than a full cycle plus its fetch time, so a sustained outage costs
+# one probe timeout every other cycle instead of a full timeout per request
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 2.0 * UPDATE_INTERVAL  # seconds
+CIRCUIT_BREAKERS = {
+    "waqi": {"failures": 0, "open_until": 0.0, "probing": False},
+    "open_meteo": {"failures": 0, "open_until": 0.0, "probing": False},
+}
+
+# WAQI error messages that affect every request made with the token
+WAQI_ACCOUNT_ERRORS = ("Invalid key", "Over quota")
+
+# Sector type flags for sectors with no configuration
+NO_SECTOR_FLAGS = {"industrial": False, "commercial": False, "residential": False}
+
+# Air quality result used when no WAQI data is available
+EMPTY_AQ_DATA = {"pm25": None, "pm10": None, "no2": None, "co": None, "traffic_index": None, "stations": 0}
+
 # Station names for Delhi NCR (from WAQI network)
 # These are actual monitoring stations in Delhi NCR
 WAQI_STATIONS = {
@@ -103,102 +245,280 @@ WAQI_STATIONS = {
 # API INTEGRATION FUNCTIONS
 # ============================================================================
 
-def fetch_waqi_geo(lat: float, lon: float) -> dict:
+class TokenBucket:
     """
-    Fetch air quality using geo coordinates (more accurate)
-    Also extracts NO2 and CO for traffic index calculation
+    Async token bucket rate limiter
+    Allows bursts of up to `capacity` requests, refilling at `rate` tokens per second
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        # Negated comparisons so NaN fails them too (it would keep the bucket full forever)
+        if not (math.isfinite(rate) and rate > 0) or not capacity >= 1:
+            raise ValueError(f"TokenBucket needs a finite rate > 0 and capacity >= 1, got rate={rate}, capacity={capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+# WAQI quota guard: a full cycle (geo + station fallbacks) fits in one burst,
+# sustained traffic is held to WAQI_RATE_LIMIT requests per minute
+WAQI_RATE_LIMIT = float(os.getenv("WAQI_RATE_LIMIT", "60"))
+if not (math.isfinite(WAQI_RATE_LIMIT) and WAQI_RATE_LIMIT > 0):
+    raise ValueError(f"WAQI_RATE_LIMIT must be a finite, positive number of requests per minute, got {WAQI_RATE_LIMIT}")
+RATE_LIMITERS = {
+    "waqi": TokenBucket(rate=WAQI_RATE_LIMIT / 60, capacity=10),
+}
+
+
+async def fetch_json(request: dict) -> Optional[dict]:
     """
+    GET one request spec through the shared client
+    Sends a conditional request when an earlier response carried validators
+    Returns the parsed JSON body, or None on any failure or open circuit
+    """
+    source = request["source"]
+    probe = circuit_open(source)  # Only admitted while open as the half-open probe
+    if not circuit_admits(source):
+        return None  # Upstream is down: skip the call, caller falls back to cached readings
+    
+    tag = request["tag"]
+    cached = CONDITIONAL_CACHE.get(tag)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.get(
-                f"{WAQI_BASE}/feed/geo:{lat};{lon}/",
-                params={"token": WAQI_TOKEN}
+        # Sources without a rate limit go straight through
+        async with RATE_LIMITERS.get(source, nullcontext()):
+            # The circuit may have opened while this request waited for a token
+            if circuit_open(source) and not probe:
+                return None
+            response = await HTTP_CLIENT.get(
+                request["url"],
+                params=request["params"],
+                headers=headers,
+                timeout=request.get("timeout", httpx.USE_CLIENT_DEFAULT)
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("status") == "ok":
-                    aqi_data = data.get("data", {})
-                    iaqi = aqi_data.get("iaqi", {})
-                    city = aqi_data.get("city", {}).get("name", "Unknown")
-                    
-                    pm25 = iaqi.get("pm25", {}).get("v")
-                    pm10 = iaqi.get("pm10", {}).get("v")
-                    
-                    # Traffic-related pollutants (from vehicle emissions)
-                    no2 = iaqi.get("no2", {}).get("v")  # Nitrogen Dioxide
-                    co = iaqi.get("co", {}).get("v")    # Carbon Monoxide
-                    
-                    # Calculate traffic index from NO2 and CO
-                    # NO2: typical range 0-200, CO: typical range 0-100
-                    traffic_index = None
-                    if no2 is not None or co is not None:
-                        # Normalize and combine: NO2 contributes 60%, CO contributes 40%
-                        no2_normalized = min(1.0, (no2 or 0) / 150) if no2 else 0.5
-                        co_normalized = min(1.0, (co or 0) / 80) if co else 0.5
-                        traffic_index = round(no2_normalized * 0.6 + co_normalized * 0.4, 2)
-                    
-                    return {
-                        "pm25": pm25 if pm25 and 0 < pm25 < 1000 else None,
-                        "pm10": pm10 if pm10 and 0 < pm10 < 2000 else None,
-                        "no2": no2,
-                        "co": co,
-                        "traffic_index": traffic_index,
-                        "station": city,
-                        "stations": 1
-                    }
+        
+        # Unchanged upstream: reuse the body parsed last time
+        if response.status_code == 304 and cached is not None:
+            record_upstream_result(source, ok=True)
+            return cached[2]
+        
+        if response.status_code == 200:
+            # orjson parses the raw bytes directly, skipping the str decode
+            data = orjson.loads(response.content)
+            account_error = waqi_account_error(data) if source == "waqi" else None
+            if account_error is None:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    CONDITIONAL_CACHE[tag] = (etag, last_modified, data)
+                record_upstream_result(source, ok=True)
+                return data
+            logger.warning("%s fetch error: WAQI %s", tag, account_error)
+        else:
+            logger.warning("%s fetch error: HTTP %s", tag, response.status_code)
     except Exception as e:
-        print(f"WAQI geo fetch error: {e}")
+        logger.warning("%s fetch error: %s", tag, e)
+    
+    record_upstream_result(source, ok=False)
+    return None
+
+
+def waqi_account_error(data) -> Optional[str]:
+    """
+    Return the message of a WAQI account-level error (bad token, quota exceeded)
+    WAQI reports these as HTTP 200 with status "error"; they fail every request
+    until fixed, so they count against the circuit breaker. Per-request errors
+    such as "Unknown station" mean WAQI is up and do not.
+    """
+    if isinstance(data, dict) and data.get("status") == "error" and data.get("data") in WAQI_ACCOUNT_ERRORS:
+        return data["data"]
+    return None
+
+
+def circuit_open(source: str) -> bool:
+    return CIRCUIT_BREAKERS[source]["failures"] >= BREAKER_FAILURE_THRESHOLD
+
+
+def circuit_admits(source: str) -> bool:
+    """
+    Whether a request to an upstream may go out
+    Always while its circuit is closed; once open, none until the cool-down
+    ends, then only the first request, as a probe
+    """
+    breaker = CIRCUIT_BREAKERS[source]
+    if not circuit_open(source):
+        return True
+    if breaker["probing"] or time.monotonic() < breaker["open_until"]:
+        return False
+    breaker["probing"] = True
+    return True
+
+
+def record_upstream_result(source: str, ok: bool):
+    """
+    Track consecutive failures per upstream and open its circuit when they pile up
+    A success closes the circuit; a failed probe re-opens it for another cool-down
+    """
+    breaker = CIRCUIT_BREAKERS[source]
+    breaker["probing"] = False
+    if ok:
+        if circuit_open(source):
+            logger.info("%s circuit closed", source)
+        breaker["failures"] = 0
+        breaker["open_until"] = 0.0
+        return
     
-    return {"pm25": None, "pm10": None, "no2": None, "co": None, "traffic_index": None, "stations": 0}
+    breaker["failures"] += 1
+    if breaker["failures"] >= BREAKER_FAILURE_THRESHOLD:
+        breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+        # Logged once per outage: later failures (in-flight requests, probes) only extend it
+        if breaker["failures"] == BREAKER_FAILURE_THRESHOLD:
+            logger.warning("%s circuit open after %d consecutive failures, probing every %.0fs",
+                           source, breaker["failures"], BREAKER_COOLDOWN)
+
+
+async def fetch_batch(requests: List[dict]) -> Dict[str, Optional[dict]]:
+    """
+    Dispatch a batch of request specs concurrently
+    Returns parsed JSON bodies keyed by each request's tag
+    """
+    results = await asyncio.gather(*(fetch_json(request) for request in requests))
+    return {request["tag"]: result for request, result in zip(requests, results)}
+
+
+def build_sector_requests() -> List[dict]:
+    """
+    One WAQI geo lookup and one Open-Meteo lookup per sector
+    """
+    requests = []
+    for sector_id, config in SECTORS_CONFIG.items():
+        lat = config["lat"]
+        lon = config["lon"]
+        requests.append({
+            "tag": f"waqi:{sector_id}",
+            "source": "waqi",
+            "url": f"/feed/geo:{lat};{lon}/",
+            "params": {"token": WAQI_TOKEN}
+        })
+        requests.append({
+            "tag": f"wind:{sector_id}",
+            "source": "open_meteo",
+            "url": "https://api.open-meteo.com/v1/forecast",
+            "params": {
+                "latitude": lat,
+                "longitude": lon,
+                "current_weather": "true"
+            },
+            "timeout": httpx.Timeout(10.0, connect=5.0)
+        })
+    return requests
 
 
-def fetch_waqi_data(sector_id: int, lat: float, lon: float) -> dict:
+def build_station_requests(sector_ids: List[int]) -> List[dict]:
     """
-    Fetch air quality data from WAQI API for a sector
-    Uses geo-based API for more accurate location data
+    Named WAQI station lookups for sectors without a geo reading
     """
-    # First try geo-based lookup (most accurate)
-    geo_data = fetch_waqi_geo(lat, lon)
-    if geo_data["pm25"] is not None:
-        return geo_data
+    requests = []
+    for sector_id in sector_ids:
+        stations = WAQI_STATIONS.get(sector_id, ["delhi"])
+        for station in stations[:2]:  # Limit to 2 stations
+            requests.append({
+                "tag": f"station:{sector_id}:{station}",
+                "source": "waqi",
+                "url": f"/feed/{station}/",
+                "params": {"token": WAQI_TOKEN}
+            })
+    return requests
+
+
+def parse_waqi_geo(data: Optional[dict]) -> dict:
+    """
+    Parse a WAQI geo feed response (more accurate)
+    Also extracts NO2 and CO for traffic index calculation
+    """
+    if not data or data.get("status") != "ok":
+        return dict(EMPTY_AQ_DATA)
+    
+    aqi_data = data.get("data", {})
+    iaqi = aqi_data.get("iaqi", {})
+    city = aqi_data.get("city", {}).get("name", "Unknown")
+    
+    pm25 = iaqi.get("pm25", {}).get("v")
+    pm10 = iaqi.get("pm10", {}).get("v")
     
-    # Fallback to station-based lookup
-    stations = WAQI_STATIONS.get(sector_id, ["delhi"])
+    # Traffic-related pollutants (from vehicle emissions)
+    no2 = iaqi.get("no2", {}).get("v")  # Nitrogen Dioxide
+    co = iaqi.get("co", {}).get("v")    # Carbon Monoxide
+    
+    # Calculate traffic index from NO2 and CO
+    # NO2: typical range 0-200, CO: typical range 0-100
+    traffic_index = None
+    if no2 is not None or co is not None:
+        # Normalize and combine: NO2 contributes 60%, CO contributes 40%
+        no2_normalized = min(1.0, (no2 or 0) / 150) if no2 else 0.5
+        co_normalized = min(1.0, (co or 0) / 80) if co else 0.5
+        traffic_index = round(no2_normalized * 0.6 + co_normalized * 0.4, 2)
+    
+    return {
+        "pm25": pm25 if pm25 and 0 < pm25 < 1000 else None,
+        "pm10": pm10 if pm10 and 0 < pm10 < 2000 else None,
+        "no2": no2,
+        "co": co,
+        "traffic_index": traffic_index,
+        "station": city,
+        "stations": 1
+    }
+
+
+def parse_waqi_stations(responses: List[Optional[dict]]) -> dict:
+    """
+    Average PM2.5 and PM10 over named WAQI station responses
+    """
     pm25_values = []
     pm10_values = []
     
-    try:
-        with httpx.Client(timeout=15.0) as client:
-            for station in stations[:2]:  # Limit to 2 stations
-                try:
-                    response = client.get(
-                        f"{WAQI_BASE}/feed/{station}/",
-                        params={"token": WAQI_TOKEN}
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get("status") == "ok":
-                            aqi_data = data.get("data", {})
-                            iaqi = aqi_data.get("iaqi", {})
-                            
-                            # Get PM2.5 value
-                            pm25 = iaqi.get("pm25", {}).get("v")
-                            if pm25 and 0 < pm25 < 1000:
-                                pm25_values.append(pm25)
-                            
-                            # Get PM10 value
-                            pm10 = iaqi.get("pm10", {}).get("v")
-                            if pm10 and 0 < pm10 < 2000:
-                                pm10_values.append(pm10)
-                                
-                except Exception as e:
-                    print(f"WAQI station {station} error: {e}")
-                    continue
-                    
-    except Exception as e:
-        print(f"WAQI fetch error: {e}")
+    for data in responses:
+        if not data or data.get("status") != "ok":
+            continue
+        iaqi = data.get("data", {}).get("iaqi", {})
+        
+        # Get PM2.5 value
+        pm25 = iaqi.get("pm25", {}).get("v")
+        if pm25 and 0 < pm25 < 1000:
+            pm25_values.append(pm25)
+        
+        # Get PM10 value
+        pm10 = iaqi.get("pm10", {}).get("v")
+        if pm10 and 0 < pm10 < 2000:
+            pm10_values.append(pm10)
     
     return {
         "pm25": sum(pm25_values) / len(pm25_values) if pm25_values else None,
@@ -210,38 +530,58 @@ def fetch_waqi_data(sector_id: int, lat: float, lon: float) -> dict:
     }
 
 
-def fetch_wind_sync(lat: float, lon: float) -> float:
+def parse_wind(data: Optional[dict]) -> Optional[float]:
     """
-    Fetch wind speed from Open-Meteo API (free, no key required)
+    Parse wind speed from an Open-Meteo response
+    Returns None when no response is available (fetch failed or circuit open)
     """
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "current_weather": "true"
-            }
-            
-            response = client.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params=params
+    if not data:
+        return None
+    
+    wind_kmh = data.get("current_weather", {}).get("windspeed", 8.0)
+    return round(wind_kmh / 3.6, 1)  # Convert km/h to m/s
+
+
+async def fetch_all_sectors() -> Dict[int, tuple]:
+    """
+    Fetch air quality and wind for every sector
+    Returns (aq_data, wind_speed) keyed by sector_id
+    """
+    # All geo and wind lookups go out as a single concurrent batch
+    responses = await fetch_batch(build_sector_requests())
+    aq_results = {
+        sector_id: parse_waqi_geo(responses[f"waqi:{sector_id}"])
+        for sector_id in SECTORS_CONFIG
+    }
+    
+    # Fallback to station-based lookup, batched across sectors
+    missing = [sector_id for sector_id, aq_data in aq_results.items() if aq_data["pm25"] is None]
+    if missing:
+        station_responses = await fetch_batch(build_station_requests(missing))
+        for sector_id in missing:
+            prefix = f"station:{sector_id}:"
+            aq_results[sector_id] = parse_waqi_stations(
+                [data for tag, data in station_responses.items() if tag.startswith(prefix)]
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                wind_kmh = data.get("current_weather", {}).get("windspeed", 8.0)
-                return round(wind_kmh / 3.6, 1)  # Convert km/h to m/s
-                
-    except Exception as e:
-        print(f"Wind fetch error: {e}")
     
-    return 2.0  # Default
+    return {
+        sector_id: (aq_results[sector_id], parse_wind(responses[f"wind:{sector_id}"]))
+        for sector_id in SECTORS_CONFIG
+    }
 
 
 def initialize_sectors():
     """Initialize sectors with default values"""
     global SECTORS_DATA
     for sector_id, config in SECTORS_CONFIG.items():
+        # Sector type from its name, checked once here instead of on every request
+        name = config["name"]
+        config["flags"] = {
+            "industrial": "Industrial" in name,
+            "commercial": "Commercial" in name,
+            "residential": "Residential" in name
+        }
+        
         SECTORS_DATA[sector_id] = {
             "id": config["id"],
             "name": config["name"],
@@ -256,89 +596,197 @@ def initialize_sectors():
             "last_update": None,
             "data_source": "initializing"
         }
+        SECTORS_DATA[sector_id]["cached_reading"] = build_cached_reading(SECTORS_DATA[sector_id])
+
+
+def build_cached_reading(sector: dict) -> dict:
+    """
+    Build the /sectors entry for a sector from its stored readings
+    Built once per update; get_sectors only adds the response timestamp
+    """
+    readings = sector["readings"]
+    return {
+        "sector_id": sector["id"],
+        "sector_name": sector["name"],
+        "pm25": readings["pm25"],
+        "pm10": readings["pm10"],
+        "traffic_index": readings["traffic_index"],
+        "wind_speed": readings["wind_speed"],
+        "last_update": sector["last_update"]
+    }
 
 initialize_sectors()
 
 
-def update_all_sectors():
+def apply_sector_update(sector_id: int, aq_data: dict, wind: Optional[float], traffic_mult: float, now: datetime):
+    """
+    Write one sector's fetched data into SECTORS_DATA
+    Cycle-wide inputs (traffic multiplier, clock) are computed once by the caller
+    """
+    config = SECTORS_CONFIG[sector_id]
+    sector = SECTORS_DATA[sector_id]
+    readings = sector["readings"]
+    
+    # Update with API data or apply variation
+    if aq_data["pm25"] is not None:
+        readings["pm25"] = round(aq_data["pm25"], 1)
+        sector["data_source"] = "waqi_live"
+    else:
+        # Small random variation if API unavailable
+        readings["pm25"] = round(max(20, readings["pm25"] * RNG.uniform(0.95, 1.05)), 1)
+        sector["data_source"] = "cached"
+    
+    if aq_data["pm10"] is not None:
+        readings["pm10"] = round(aq_data["pm10"], 1)
+    else:
+        readings["pm10"] = round(max(30, readings["pm10"] * RNG.uniform(0.95, 1.05)), 1)
+    
+    # Store NO2 and CO values
+    if aq_data.get("no2") is not None:
+        readings["no2"] = round(aq_data["no2"], 1)
+    if aq_data.get("co") is not None:
+        readings["co"] = round(aq_data["co"], 2)
+    
+    # Keep the last known wind speed if Open-Meteo is unavailable
+    if wind is not None:
+        readings["wind_speed"] = wind
+    
+    # Traffic index from real NO2/CO data or time-based simulation
+    if aq_data.get("traffic_index") is not None:
+        # Use real traffic index derived from NO2 and CO
+        readings["traffic_index"] = aq_data["traffic_index"]
+        traffic_source = "NO2/CO"
+    else:
+        # Fallback: Time-based simulation
+        readings["traffic_index"] = round(min(1.0, max(0.1,
+            config["traffic_base"] * traffic_mult * RNG.uniform(0.9, 1.1)
+        )), 2)
+        traffic_source = "simulated"
+    
+    sector["last_update"] = now.isoformat()
+    sector["cached_reading"] = build_cached_reading(sector)
+    
+    src_label = "🔴 LIVE" if "live" in sector['data_source'] else "⚪ cached"
+    logger.info(
+        "[%s] %s: PM2.5=%s, PM10=%s, Traffic=%.2f (%s), Wind=%sm/s (%s)",
+        now.strftime('%H:%M:%S'), config['name'],
+        readings['pm25'], readings['pm10'],
+        readings['traffic_index'], traffic_source,
+        readings['wind_speed'], src_label
+    )
+
+
+def sector_key(sector_id: int) -> str:
+    return f"{REDIS_PREFIX}:sector:{sector_id}"
+
+
+def shared_version_key() -> str:
+    return f"{REDIS_PREFIX}:version"
+
+
+async def acquire_refresh_lock() -> Optional[bool]:
+    """
+    Take or renew the refresh lock for this worker (owner-checked, in one script)
+    True if this worker holds the lock, False if another worker holds it,
+    None without a usable Redis (refresh locally, on the normal cycle)
+    """
+    if REDIS is None:
+        return None
+    try:
+        return bool(await REDIS.eval(
+            REFRESH_LOCK_SCRIPT, 1, f"{REDIS_PREFIX}:refresh_lock", WORKER_ID, UPDATE_INTERVAL
+        ))
+    except Exception as e:
+        logger.warning("Redis lock error, refreshing locally: %s", e)
+        return None
+
+
+async def publish_sectors():
+    """Store this worker's sector snapshots in Redis and bump the shared version"""
+    global SHARED_VERSION
+    try:
+        async with REDIS.pipeline(transaction=True) as pipe:
+            pipe.mset({
+                sector_key(sector_id): orjson.dumps(sector)
+                for sector_id, sector in SECTORS_DATA.items()
+            })
+            pipe.incr(shared_version_key())
+            _, SHARED_VERSION = await pipe.execute()
+    except Exception as e:
+        logger.warning("Redis publish error: %s", e)
+
+
+async def load_shared_sectors() -> bool:
+    """
+    Replace local sector data with the snapshots in Redis if their version moved
+    Returns True if anything changed
+    """
+    global SHARED_VERSION
+    version = await REDIS.get(shared_version_key())
+    if version is None or int(version) == SHARED_VERSION:
+        return False
+    
+    # Read version and snapshots together so they always belong to one publish
+    sector_ids = list(SECTORS_DATA)
+    async with REDIS.pipeline(transaction=True) as pipe:
+        pipe.get(shared_version_key())
+        pipe.mget([sector_key(sector_id) for sector_id in sector_ids])
+        version, values = await pipe.execute()
+    
+    for sector_id, value in zip(sector_ids, values):
+        if value is not None:
+            SECTORS_DATA[sector_id] = orjson.loads(value)
+    SHARED_VERSION = int(version)
+    return True
+
+
+async def refresh_sectors():
+    """Fetch every sector from the upstream APIs and store the readings"""
+    sector_results = await fetch_all_sectors()
+    
+    # One clock read per cycle, shared by every sector
+    now = datetime.now()
+    traffic_mult = HOUR_TRAFFIC_MULT[now.hour]
+    
+    for sector_id, (aq_data, wind) in sector_results.items():
+        apply_sector_update(sector_id, aq_data, wind, traffic_mult, now)
+
+
+async def update_all_sectors():
     """
-    Background thread: Update all sectors from APIs
+    Background task: Update all sectors from APIs
     """
+    global DATA_VERSION
+    next_refresh = 0.0  # time.monotonic() at which the lock holder refreshes next
     while True:
         try:
-            for sector_id, config in SECTORS_CONFIG.items():
-                lat = config["lat"]
-                lon = config["lon"]
-                
-                # Fetch real data from WAQI API
-                aq_data = fetch_waqi_data(sector_id, lat, lon)
-                wind = fetch_wind_sync(lat, lon)
-                
-                readings = SECTORS_DATA[sector_id]["readings"]
-                
-                # Update with API data or apply variation
-                if aq_data["pm25"] is not None:
-                    readings["pm25"] = round(aq_data["pm25"], 1)
-                    SECTORS_DATA[sector_id]["data_source"] = "waqi_live"
-                else:
-                    # Small random variation if API unavailable
-                    readings["pm25"] = max(20, readings["pm25"] * random.uniform(0.95, 1.05))
-                    SECTORS_DATA[sector_id]["data_source"] = "cached"
-                
-                if aq_data["pm10"] is not None:
-                    readings["pm10"] = round(aq_data["pm10"], 1)
-                else:
-                    readings["pm10"] = max(30, readings["pm10"] * random.uniform(0.95, 1.05))
-                
-                # Store NO2 and CO values
-                if aq_data.get("no2") is not None:
-                    readings["no2"] = round(aq_data["no2"], 1)
-                if aq_data.get("co") is not None:
-                    readings["co"] = round(aq_data["co"], 2)
-                
-                readings["wind_speed"] = wind
-                
-                # Traffic index from real NO2/CO data or time-based simulation
-                if aq_data.get("traffic_index") is not None:
-                    # Use real traffic index derived from NO2 and CO
-                    readings["traffic_index"] = aq_data["traffic_index"]
-                    traffic_source = "NO2/CO"
-                else:
-                    # Fallback: Time-based simulation
-                    hour = datetime.now().hour
-                    if 8 <= hour <= 10 or 17 <= hour <= 19:
-                        traffic_mult = 1.3  # Rush hour
-                    elif 22 <= hour or hour <= 5:
-                        traffic_mult = 0.4  # Night
-                    else:
-                        traffic_mult = 1.0
-                    
-                    readings["traffic_index"] = min(1.0, max(0.1,
-                        config["traffic_base"] * traffic_mult * random.uniform(0.9, 1.1)
-                    ))
-                    traffic_source = "simulated"
-                
-                SECTORS_DATA[sector_id]["last_update"] = get_timestamp()
-                
-                src_label = "🔴 LIVE" if "live" in SECTORS_DATA[sector_id]['data_source'] else "⚪ cached"
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] {config['name']}: "
-                      f"PM2.5={readings['pm25']}, PM10={readings['pm10']}, "
-                      f"Traffic={readings['traffic_index']:.2f} ({traffic_source}), "
-                      f"Wind={readings['wind_speed']}m/s ({src_label})")
-                
-                time.sleep(2)  # Small delay between sector updates
+            lock = await acquire_refresh_lock()
+            if lock is False:
+                # Another worker holds the lock; take its readings once published
+                changed = await load_shared_sectors()
+                if changed:
+                    # Keep the holder's cadence if this worker takes over
+                    next_refresh = time.monotonic() + UPDATE_INTERVAL
+            elif lock is None or time.monotonic() >= next_refresh:
+                await refresh_sectors()
+                if lock:
+                    await publish_sectors()
+                next_refresh = time.monotonic() + UPDATE_INTERVAL
+                changed = True
+            else:
+                changed = False
             
-            # Wait 60 seconds before next update cycle
-            time.sleep(60)
+            # Fresh readings invalidate every cached endpoint response
+            if changed:
+                DATA_VERSION += 1
+            
+            # With Redis every worker checks in every poll interval (the holder
+            # to renew its lock); without it, wait for the next cycle
+            await asyncio.sleep(SHARED_POLL_INTERVAL if lock is not None else UPDATE_INTERVAL)
             
         except Exception as e:
-            print(f"Update error: {e}")
-            time.sleep(30)
-
-
-# Start background thread
-data_thread = threading.Thread(target=update_all_sectors, daemon=True)
-data_thread.start()
+            logger.error("Update error: %s", e)
+            await asyncio.sleep(30)
 
 
 # ============================================================================
@@ -349,39 +797,86 @@ def get_timestamp():
     return datetime.now().isoformat()
 
 
-def detect_pollution_cause(pm25: float, pm10: float, traffic_index: float, sector_name: str = "") -> str:
+def get_cached_response(key: tuple):
+    """Return a cached endpoint response if it is unexpired and from the current data version"""
+    entry = RESPONSE_CACHE.get(key)
+    if entry is not None:
+        expires_at, version, payload = entry
+        if version == DATA_VERSION and time.monotonic() < expires_at:
+            return payload
+    return None
+
+
+def set_cached_response(key: tuple, version: int, payload):
+    """Cache an endpoint response computed from the given data version"""
+    RESPONSE_CACHE[key] = (time.monotonic() + RESPONSE_CACHE_TTL, version, payload)
+
+
+# Pollution cause descriptions, indexed by classify_pollution_source()
+POLLUTION_CAUSES = (
+    "Dust and construction activity (high coarse particles)",
+    "Vehicle emissions and industrial pollution (fine particles)",
+    "Mixed traffic and dust pollution",
+    "Industrial emissions (high particulate concentration)",
+    "Residential emissions and traffic (balanced sources)",
+    "Commercial area pollution (traffic congestion and activities)",
+    "Mixed pollution sources (dust, traffic, and industrial)",
+)
+
+
+def classify_pollution_source(
+    pm25: float,
+    pm_ratio: float,
+    traffic_index: float,
+    is_industrial: bool,
+    is_residential: bool,
+    is_commercial: bool
+) -> int:
     """
-    Intelligent pollution source detection based on pollutant ratios and sector characteristics
+    Pollution source decision ladder on plain numbers and flags
+    Returns an index into POLLUTION_CAUSES
     """
-    pm_ratio = pm10 / pm25 if pm25 > 0 else 1
-    
     # High PM10 relative to PM2.5 suggests dust/construction
     if pm_ratio > 2.5:
-        return "Dust and construction activity (high coarse particles)"
+        return 0
     
     # Very low PM10 relative to PM2.5 suggests fine particle sources (traffic/industry)
     elif pm_ratio < 0.8 and traffic_index > 0.25:
-        return "Vehicle emissions and industrial pollution (fine particles)"
+        return 1
     
     # Moderate ratio with high traffic indicator
     elif pm_ratio > 0.8 and pm_ratio <= 2.0 and traffic_index > 0.3:
-        return "Mixed traffic and dust pollution"
+        return 2
     
     # Industrial sectors with high PM levels
-    elif "Industrial" in sector_name and pm25 > 150:
-        return "Industrial emissions (high particulate concentration)"
+    elif is_industrial and pm25 > 150:
+        return 3
     
     # Residential sectors
-    elif "Residential" in sector_name and pm_ratio < 1.5:
-        return "Residential emissions and traffic (balanced sources)"
+    elif is_residential and pm_ratio < 1.5:
+        return 4
     
     # Commercial areas
-    elif "Commercial" in sector_name:
-        return "Commercial area pollution (traffic congestion and activities)"
+    elif is_commercial:
+        return 5
     
     # Default fallback
     else:
-        return "Mixed pollution sources (dust, traffic, and industrial)"
+        return 6
+
+
+def detect_pollution_cause(pm25: float, pm10: float, traffic_index: float, sector_flags: dict = NO_SECTOR_FLAGS) -> str:
+    """
+    Intelligent pollution source detection based on pollutant ratios and sector characteristics
+    """
+    pm_ratio = pm10 / pm25 if pm25 > 0 else 1
+    cause = classify_pollution_source(
+        pm25, pm_ratio, traffic_index,
+        sector_flags["industrial"],
+        sector_flags["residential"],
+        sector_flags["commercial"]
+    )
+    return POLLUTION_CAUSES[cause]
 
 
 # ============================================================================
@@ -418,23 +913,10 @@ SOURCE_CONTRIBUTIONS = {
     "secondary": 0.12,     # 12% secondary aerosols
 }
 
-def calculate_meteorological_factor(wind_speed: float, hour: int = None) -> float:
+def meteorological_factor(wind_speed: float, is_daytime: bool) -> float:
     """
-    Meteorological adjustment factor based on atmospheric stability.
-    Uses Pasquill-Gifford stability classes simplified approach.
-    
-    References:
-    - Turner, D.B. (1970) Workbook of Atmospheric Dispersion Estimates
-    - EPA AERMOD documentation
+    Wind and boundary layer adjustment on plain numbers; see calculate_meteorological_factor
     """
-    from datetime import datetime
-    
-    if hour is None:
-        hour = datetime.now().hour
-    
-    # Daytime vs nighttime stability
-    is_daytime = 6 <= hour <= 18
-    
     # Wind speed factor (ventilation coefficient proxy)
     if wind_speed < 1.0:
         wind_factor = 0.5  # Very stable, poor dispersion
@@ -456,6 +938,24 @@ def calculate_meteorological_factor(wind_speed: float, hour: int = None) -> floa
     return wind_factor * mixing_factor
 
 
+def calculate_meteorological_factor(wind_speed: float, hour: int = None) -> float:
+    """
+    Meteorological adjustment factor based on atmospheric stability.
+    Uses Pasquill-Gifford stability classes simplified approach.
+    
+    References:
+    - Turner, D.B. (1970) Workbook of Atmospheric Dispersion Estimates
+    - EPA AERMOD documentation
+    """
+    if hour is None:
+        hour = datetime.now().hour
+    
+    # Daytime vs nighttime stability
+    is_daytime = HOUR_IS_DAY[hour]
+    
+    return meteorological_factor(wind_speed, is_daytime)
+
+
 def simulate_policy_impact(
     effectiveness_range: tuple,
     wind_speed: float,
@@ -492,6 +992,9 @@ def simulate_wind_impact(effectiveness: float, wind_speed: float) -> float:
 # POLICY ENGINE
 # ============================================================================
 
+# Readings are stored pre-rounded and change at most once per update cycle, so
+# the same inputs recur across requests; results are shared (PolicyRecommendation is frozen)
+@lru_cache(maxsize=512)
 def generate_policy_recommendation(
     sector_id: int,
     pm25: float,
@@ -500,13 +1003,12 @@ def generate_policy_recommendation(
     wind_speed: float
 ) -> Optional[PolicyRecommendation]:
     
-    sector_config = SECTORS_CONFIG.get(sector_id, {})
-    sector_name = sector_config.get("name", "")
+    flags = SECTORS_CONFIG.get(sector_id, {}).get("flags", NO_SECTOR_FLAGS)
     pm_ratio = pm10 / pm25 if pm25 > 0 else 1
     
     # Critical: High PM2.5 with heavy traffic and poor wind
     if pm25 > 250 and traffic_index > 0.5 and wind_speed < 2:
-        if "Industrial" in sector_name:
+        if flags["industrial"]:
             return PolicyRecommendation(
                 policy_name="Industrial Emission Control + Vehicle Restrictions",
                 reason=f"Critical pollution in industrial area: PM2.5={pm25:.0f}, Traffic index={traffic_index:.1f}, Wind={wind_speed:.1f}m/s",
@@ -535,7 +1037,7 @@ def generate_policy_recommendation(
     
     # High PM2.5 with traffic as primary source
     if pm25 > 200 and traffic_index > 0.3 and pm_ratio < 1.5:
-        if "Commercial" in sector_name:
+        if flags["commercial"]:
             return PolicyRecommendation(
                 policy_name="Peak Hour Traffic Restrictions",
                 reason=f"High PM2.5 ({pm25:.0f}) driven by traffic in commercial area (Traffic index: {traffic_index:.1f})",
@@ -543,7 +1045,7 @@ def generate_policy_recommendation(
                 estimated_time_hours=8,
                 priority="high"
             )
-        elif "Residential" in sector_name:
+        elif flags["residential"]:
             return PolicyRecommendation(
                 policy_name="Odd-Even Vehicle Scheme",
                 reason=f"High PM2.5 ({pm25:.0f}) with moderate traffic impact in residential area",
@@ -586,9 +1088,18 @@ def generate_policy_recommendation(
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
+# Handlers only read in-process data, so they are async def: a sync def would
+# cost two threadpool hops per request (handler, then response validation).
+# Declared return types let FastAPI serialize straight to JSON bytes in
+# pydantic-core instead of via jsonable_encoder + json
+
+def sector_not_found() -> JSONResponse:
+    # A Response is returned as-is, bypassing the declared return type
+    return JSONResponse({"error": "Sector not found"}, status_code=404)
+
 
 @app.get("/")
-def root():
+async def root() -> dict:
     return {
         "message": "Urban Policy Decision Engine API",
         "version": "2.0.0",
@@ -597,27 +1108,28 @@ def root():
     }
 
 
-@app.get("/sectors", response_model=List[SectorReading])
-def get_sectors():
-    readings = []
-    for sector_id, sector_data in SECTORS_DATA.items():
-        readings.append(SectorReading(
-            sector_id=sector_data["id"],
-            sector_name=sector_data["name"],
-            pm25=round(sector_data["readings"]["pm25"], 1),
-            pm10=round(sector_data["readings"]["pm10"], 1),
-            traffic_index=round(sector_data["readings"]["traffic_index"], 2),
-            wind_speed=round(sector_data["readings"]["wind_speed"], 1),
-            timestamp=get_timestamp()
-        ))
-    return readings
+# The entries are prebuilt by the updater, so they are serialized with orjson
+# as-is, without validation against SectorReading (which only documents the
+# schema in OpenAPI)
+@app.get("/sectors", response_model=None, responses={200: {"model": List[SectorReading]}})
+async def get_sectors():
+    timestamp = get_timestamp()
+    return Response(orjson.dumps([
+        {**sector_data["cached_reading"], "timestamp": timestamp}
+        for sector_data in SECTORS_DATA.values()
+    ]), media_type="application/json")
 
 
 @app.get("/sector/{sector_id}/status")
-def get_sector_status(sector_id: int):
+async def get_sector_status(sector_id: int) -> dict:
     if sector_id not in SECTORS_DATA:
-        return {"error": "Sector not found"}, 404
+        return sector_not_found()
     
+    cached = get_cached_response(("status", sector_id))
+    if cached is not None:
+        return {**cached, "timestamp": get_timestamp()}
+    
+    version = DATA_VERSION
     sector = SECTORS_DATA[sector_id]
     sector_config = SECTORS_CONFIG.get(sector_id, {})
     readings = sector["readings"]
@@ -633,33 +1145,33 @@ def get_sector_status(sector_id: int):
     else:
         severity = "moderate"
     
-    return {
+    response = {
         "sector_id": sector["id"],
         "sector_name": sector["name"],
-        "readings": {
-            "pm25": round(readings["pm25"], 1),
-            "pm10": round(readings["pm10"], 1),
-            "no2": round(readings.get("no2", 0), 1),
-            "co": round(readings.get("co", 0), 2),
-            "traffic_index": round(readings["traffic_index"], 2),
-            "wind_speed": round(readings["wind_speed"], 1)
-        },
+        "readings": dict(readings),  # Already rounded by the updater
         "severity": severity,
         "pollution_cause": detect_pollution_cause(
             readings["pm25"], readings["pm10"], readings["traffic_index"],
-            sector_config.get("name", "")
+            sector_config.get("flags", NO_SECTOR_FLAGS)
         ),
         "data_source": sector.get("data_source", "unknown"),
-        "last_update": sector.get("last_update"),
-        "timestamp": get_timestamp()
+        "last_update": sector.get("last_update")
     }
+    
+    set_cached_response(("status", sector_id), version, response)
+    return {**response, "timestamp": get_timestamp()}
 
 
 @app.get("/sector/{sector_id}/policy")
-def get_sector_policy(sector_id: int):
+async def get_sector_policy(sector_id: int) -> dict:
     if sector_id not in SECTORS_DATA:
-        return {"error": "Sector not found"}, 404
+        return sector_not_found()
     
+    cached = get_cached_response(("policy", sector_id))
+    if cached is not None:
+        return {**cached, "timestamp": get_timestamp()}
+    
+    version = DATA_VERSION
     sector = SECTORS_DATA[sector_id]
     readings = sector["readings"]
     
@@ -669,35 +1181,34 @@ def get_sector_policy(sector_id: int):
     )
     
     if policy:
-        return {
+        response = {
             "sector_id": sector_id,
             "sector_name": sector["name"],
             "has_policy": True,
             "policy": {
                 "name": policy.policy_name,
-                "reason": policy.reason,
-                "expected_pm25_reduction_percentage": policy.expected_pm25_reduction_percentage,
-                "estimated_time_hours": policy.estimated_time_hours,
-                "priority": policy.priority
-            },
-            "timestamp": get_timestamp()
+                **policy.model_dump(exclude={"policy_name"})
+            }
         }
     else:
-        return {
+        response = {
             "sector_id": sector_id,
             "sector_name": sector["name"],
             "has_policy": False,
-            "message": "Pollution levels acceptable. Continue monitoring.",
-            "timestamp": get_timestamp()
+            "message": "Pollution levels acceptable. Continue monitoring."
         }
+    
+    set_cached_response(("policy", sector_id), version, response)
+    return {**response, "timestamp": get_timestamp()}
 
 
 @app.post("/simulate")
-def simulate_policy(sector_id: int, policy_name: str):
+async def simulate_policy(sector_id: int, policy_name: str) -> dict:
     if sector_id not in SECTORS_DATA:
-        return {"error": "Sector not found"}, 404
+        return sector_not_found()
     
     sector = SECTORS_DATA[sector_id]
+    is_industrial = SECTORS_CONFIG[sector_id]["flags"]["industrial"]
     readings = sector["readings"]
     current_pm25 = readings["pm25"]
     wind_speed = readings["wind_speed"]
@@ -718,8 +1229,8 @@ def simulate_policy(sector_id: int, policy_name: str):
         source_match = min(1.0, (pm_ratio - 1) * 0.5 + 0.5)  # Higher if dust is evident
         confidence = "high" if pm_ratio > 1.5 else "medium"
     elif "Industrial" in policy_name:
-        source_match = 0.85 if "Industrial" in sector["name"] else 0.5
-        confidence = "high" if "Industrial" in sector["name"] else "low"
+        source_match = 0.85 if is_industrial else 0.5
+        confidence = "high" if is_industrial else "low"
     else:
         source_match = 0.7
         confidence = "medium"
@@ -743,7 +1254,7 @@ def simulate_policy(sector_id: int, policy_name: str):
         "sector_id": sector_id,
         "sector_name": sector["name"],
         "policy_name": policy_name,
-        "current_pm25": round(current_pm25, 1),
+        "current_pm25": current_pm25,
         "simulated_pm25_after": round(simulated_pm25, 1),
         "pm25_range": {
             "best_case": round(min_pm25, 1),
@@ -759,14 +1270,14 @@ def simulate_policy(sector_id: int, policy_name: str):
         "confidence": confidence,
         "methodology": "Based on CPCB/DPCC/IIT Delhi studies",
         "explanation": explanation,
-        "wind_speed": round(wind_speed, 1),
+        "wind_speed": wind_speed,
         "met_adjustment_factor": impact["met_factor"],
         "timestamp": get_timestamp()
     }
 
 
 @app.get("/api/status")
-def api_status():
+async def api_status() -> dict:
     """Check API connection status"""
     sectors_info = {}
     for sid, sdata in SECTORS_DATA.items():
@@ -790,6 +1301,11 @@ def api_status():
 if __name__ == "__main__":
     import uvicorn
     
+    # Without Redis each worker keeps its own sector data and polls the upstream
+    # APIs independently, so only default to one worker per CPU when it is shared
+    default_workers = (os.cpu_count() or 1) if REDIS_URL else 1
+    workers = int(os.getenv("WEB_CONCURRENCY", default_workers))
+    
     print("=" * 60)
     print("Urban Policy Decision Engine - Real-time Data")
     print("=" * 60)
@@ -799,6 +1315,16 @@ if __name__ == "__main__":
     print("=" * 60)
     print("Server: http://localhost:8000")
     print("Docs:   http://localhost:8000/docs")
+    print(f"Workers: {workers} (uvloop + httptools)")
     print("=" * 60)
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    # Import string (not the app object) so uvicorn can spawn worker processes
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        log_level="info"
+    )